@@ -8,9 +8,24 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
+try:
+    from homeassistant.helpers import panel_iframe as _panel_iframe
+except ImportError:
+    _panel_iframe = None
 
 from .azure_client import AzureFaceClient, AzureFaceAPIError
-from .const import DOMAIN, CONF_API_KEY, CONF_ENDPOINT, CONF_PERSON_GROUP_ID
+from .const import (
+    DOMAIN,
+    DATA_FIRST_ENTRY,
+    CONF_API_KEY,
+    CONF_ENDPOINT,
+    CONF_FAST_MODE,
+    CONF_PERSON_GROUP_ID,
+    CONF_MAX_CONCURRENCY,
+    DEFAULT_FAST_MODE,
+    DEFAULT_MAX_CONCURRENCY,
+)
+from .helpers import invalidate as invalidate_resolved
 from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -29,16 +44,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     api_key = entry.data[CONF_API_KEY]
     endpoint = entry.data[CONF_ENDPOINT]
     person_group_id = entry.data[CONF_PERSON_GROUP_ID]
+    max_concurrency = entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
 
     # Create the Azure Face client
-    client = AzureFaceClient(hass, endpoint, api_key)
+    client = AzureFaceClient.get_or_create(
+        hass, endpoint, api_key, max_concurrency=max_concurrency
+    )
 
     # Test the connection
     try:
         if not await client.test_connection():
+            await client.async_release()
             raise ConfigEntryNotReady("Unable to connect to Azure Face API")
     except AzureFaceAPIError as err:
         _LOGGER.error("Failed to connect to Azure Face API: %s", err)
+        await client.async_release()
         raise ConfigEntryNotReady("Unable to connect to Azure Face API") from err
 
     # Store the client and configuration
@@ -46,10 +66,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "client": client,
         "person_group_id": person_group_id,
         "config": entry,
+        "api_semaphore": asyncio.Semaphore(max_concurrency),
     }
+    # Remember the first entry so helpers can find it without iterating
+    hass.data[DOMAIN].setdefault(DATA_FIRST_ENTRY, entry.entry_id)
 
     # Set up services
-    await async_setup_services(hass)
+    await _async_register_services(hass)
+
+    # Reload when options change so they take effect
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     # Register the person management panel
     await async_register_panel(hass)
@@ -61,6 +87,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the services using the fast mode option of the first entry.
+
+    The services are shared by all entries, so the option is read from the
+    entry the helpers fall back to rather than from whichever loaded last.
+    """
+    first_entry = hass.data[DOMAIN][hass.data[DOMAIN][DATA_FIRST_ENTRY]]["config"]
+    await async_setup_services(
+        hass, fast_mode=first_entry.options.get(CONF_FAST_MODE, DEFAULT_FAST_MODE)
+    )
+
+
 async def async_register_panel(hass: HomeAssistant) -> None:
     """Register the person management panel."""
     # Register the static files
@@ -71,36 +109,40 @@ async def async_register_panel(hass: HomeAssistant) -> None:
     )
     
     # Register the panel using the most compatible approach
-    try:
-        # This is the modern approach for Home Assistant 2023.x+
-        from homeassistant.helpers import panel_iframe
-        await panel_iframe.async_register_panel(
-            hass,
-            DOMAIN,
-            "Azure Face",
-            "mdi:face-recognition",
-            f"/{DOMAIN}/person-management.html",
-            require_admin=True,
-        )
-    except (ImportError, AttributeError):
-        # Fallback for older Home Assistant versions
-        _LOGGER.warning("Could not register panel using panel_iframe helper, trying alternative method")
+    if _panel_iframe is not None:
         try:
-            # Try using the entity registry approach
-            await hass.helpers.discovery.async_load_platform(
-                "frontend", 
-                "panel", 
-                {
-                    "frontend_url_path": DOMAIN,
-                    "title": "Azure Face",
-                    "icon": "mdi:face-recognition",
-                    "config": {"url": f"/{DOMAIN}/person-management.html"},
-                    "require_admin": True,
-                },
-                {}
+            # This is the modern approach for Home Assistant 2023.x+
+            await _panel_iframe.async_register_panel(
+                hass,
+                DOMAIN,
+                "Azure Face",
+                "mdi:face-recognition",
+                f"/{DOMAIN}/person-management.html",
+                require_admin=True,
             )
-        except Exception as ex:
-            _LOGGER.warning("Unable to register Azure Face panel: %s", ex)
+            return
+        except Exception as ex:  # pylint: disable=broad-except
+            # Any failure here falls through to the older registration method
+            _LOGGER.debug("panel_iframe registration failed: %s", ex)
+
+    # Fallback for older Home Assistant versions
+    _LOGGER.warning("Could not register panel using panel_iframe helper, trying alternative method")
+    try:
+        # Try using the entity registry approach
+        await hass.helpers.discovery.async_load_platform(
+            "frontend", 
+            "panel", 
+            {
+                "frontend_url_path": DOMAIN,
+                "title": "Azure Face",
+                "icon": "mdi:face-recognition",
+                "config": {"url": f"/{DOMAIN}/person-management.html"},
+                "require_admin": True,
+            },
+            {}
+        )
+    except Exception as ex:
+        _LOGGER.warning("Unable to register Azure Face panel: %s", ex)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -112,15 +154,24 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             return False
 
     # Remove the entry from hass.data
-    hass.data[DOMAIN].pop(entry.entry_id)
+    entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+    invalidate_resolved()
+    if hass.data[DOMAIN].get(DATA_FIRST_ENTRY) == entry.entry_id:
+        remaining = [key for key in hass.data[DOMAIN] if key != DATA_FIRST_ENTRY]
+        if remaining:
+            hass.data[DOMAIN][DATA_FIRST_ENTRY] = remaining[0]
+            await _async_register_services(hass)
+        else:
+            hass.data[DOMAIN].pop(DATA_FIRST_ENTRY)
+    # Other entries may share this client; it is closed with its last user
+    await entry_data["client"].async_release()
 
     return True
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
 
 
 # Helper functions are now in helpers.py to avoid circular imports
@@ -1,19 +1,32 @@
 """Azure Face API client for Home Assistant integration."""
 import asyncio
+import contextlib
 import logging
+import random
+import time
 import aiohttp
-import json
-from typing import Any, Dict, List, Optional, Union
-from PIL import Image
-import io
+import orjson
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import base64
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 from homeassistant.core import HomeAssistant
 
 from .const import (
+    CONNECTOR_LIMIT,
+    CONNECTOR_LIMIT_PER_HOST,
+    DNS_CACHE_TTL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CACHE_TTL,
     DEFAULT_TIMEOUT,
+    MAX_FACES_PER_IDENTIFY,
     MAX_IMAGE_SIZE,
+    MAX_RETRIES,
+    RETRY_BACKOFF_BASE,
+    RETRY_BACKOFF_CAP,
     SUPPORTED_IMAGE_FORMATS,
     ERROR_INVALID_IMAGE,
     ERROR_NO_FACE_DETECTED,
@@ -24,6 +37,27 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Leading bytes of the supported image formats
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"BM", "image/bmp"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+
+# Shared clients keyed by (endpoint, api_key, max_concurrency); the pool size
+# depends on max_concurrency, so clients sized differently are not shared
+_CLIENT_CACHE: Dict[Tuple[str, str, int], "AzureFaceClient"] = {}
+
+
+def sniff_image_mime(image_data: bytes) -> Optional[str]:
+    """Return the MIME type of a supported image from its magic bytes, or None."""
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if image_data.startswith(signature):
+            return mime_type
+    return None
+
 
 class AzureFaceAPIError(Exception):
     """Exception raised for Azure Face API errors."""
@@ -36,12 +70,119 @@ class AzureFaceAPIError(Exception):
 class AzureFaceClient:
     """Client for Azure Face API."""
 
-    def __init__(self, hass: HomeAssistant, endpoint: str, api_key: str):
-        """Initialize the Azure Face client."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        endpoint: str,
+        api_key: str,
+        dedicated_session: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the Azure Face client.
+
+        By default the client owns an aiohttp session with its own connection
+        pool, so bursts of Face API calls are not starved by other integrations.
+        Pass dedicated_session=False to use Home Assistant's shared session.
+        The pool is sized so max_concurrency calls never wait for a connection.
+        """
         self.hass = hass
         self.endpoint = endpoint.rstrip("/")
         self.api_key = api_key
-        self.session = async_get_clientsession(hass)
+        self._dedicated_session = dedicated_session
+        self._max_concurrency = max_concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._closed = False
+        self._unsub_close: Optional[Callable[[], None]] = None
+        self._base_headers = {"Ocp-Apim-Subscription-Key": api_key}
+        self._json_headers = {**self._base_headers, "Content-Type": "application/json"}
+        self._binary_headers = {**self._base_headers, "Content-Type": "application/octet-stream"}
+        self._timeout = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+        self._get_cache: Dict[str, Tuple[float, Any]] = {}
+        # Set when shared through get_or_create
+        self._cache_key: Optional[Tuple[str, str, int]] = None
+        self._users = 0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the session used for Face API requests, creating it if needed."""
+        # Calls still in flight after async_close use the shared session rather
+        # than creating a dedicated one that nothing would close
+        if not self._dedicated_session or self._closed:
+            return async_get_clientsession(self.hass)
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=max(CONNECTOR_LIMIT, 2 * self._max_concurrency),
+                    limit_per_host=max(CONNECTOR_LIMIT_PER_HOST, self._max_concurrency),
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    enable_cleanup_closed=True,
+                ),
+                timeout=self._timeout,
+            )
+            if self._unsub_close is None:
+                self._unsub_close = self.hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_CLOSE, self._async_close_session
+                )
+        return self._session
+
+    async def _async_close_session(self, _event: Any = None) -> None:
+        """Close the dedicated session, if one was created."""
+        if self._unsub_close is not None and _event is None:
+            self._unsub_close()
+        self._unsub_close = None
+
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @classmethod
+    def get_or_create(
+        cls,
+        hass: HomeAssistant,
+        endpoint: str,
+        api_key: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> "AzureFaceClient":
+        """Return a shared client for the endpoint and API key, creating it if needed.
+
+        Every call must be paired with async_release once the caller is done.
+        """
+        key = (endpoint.rstrip("/"), api_key, max_concurrency)
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = _CLIENT_CACHE[key] = cls(
+                hass, endpoint, api_key, max_concurrency=max_concurrency
+            )
+            client._cache_key = key
+        client._users += 1
+        return client
+
+    async def async_release(self) -> None:
+        """Drop one user of a shared client, closing it once nobody uses it."""
+        self._users -= 1
+        if self._users > 0:
+            return
+
+        self._users = 0
+        if self._cache_key is not None and _CLIENT_CACHE.get(self._cache_key) is self:
+            del _CLIENT_CACHE[self._cache_key]
+        self._cache_key = None
+        await self.async_close()
+
+    async def __aenter__(self) -> "AzureFaceClient":
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit the client context and release cached state."""
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Release cached responses and connection state."""
+        self._closed = True
+        self._get_cache.clear()
+        await self._async_close_session()
 
     async def _make_request(
         self,
@@ -52,57 +193,113 @@ class AzureFaceClient:
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """Make a request to the Azure Face API."""
-        default_headers = {
-            "Ocp-Apim-Subscription-Key": self.api_key,
-        }
-        
-        if headers:
-            default_headers.update(headers)
-
         if isinstance(data, dict):
-            default_headers["Content-Type"] = "application/json"
-            data = json.dumps(data).encode("utf-8")
+            request_headers = self._json_headers
+            data = orjson.dumps(data)
         elif isinstance(data, bytes):
-            default_headers["Content-Type"] = "application/octet-stream"
+            request_headers = self._binary_headers
+            # A sized payload lets aiohttp send Content-Length and write the body
+            # straight to the socket instead of buffering it as a single chunk
+            data = aiohttp.BytesPayload(data, content_type="application/octet-stream")
+        else:
+            request_headers = self._base_headers
 
-        try:
-            async with self.session.request(
-                method,
-                url,
-                data=data,
-                params=params,
-                headers=default_headers,
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
-            ) as response:
-                response_text = await response.text()
-                
-                if response.status == 401:
-                    raise AzureFaceAPIError(
-                        "Authentication failed. Please check your API key.",
-                        ERROR_AUTHENTICATION_FAILED
-                    )
-                elif response.status == 429:
-                    raise AzureFaceAPIError(
-                        "API quota exceeded. Please wait before retrying.",
-                        ERROR_QUOTA_EXCEEDED
+        if headers:
+            request_headers = request_headers | headers
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with self.session.request(
+                    method,
+                    url,
+                    data=data,
+                    params=params,
+                    headers=request_headers,
+                    timeout=self._timeout,
+                ) as response:
+                    # Server errors are only retried for GETs, since a POST may
+                    # already have created a person or face before failing
+                    retryable = response.status == 429 or (
+                        response.status >= 500 and method == "GET"
                     )
-                elif response.status >= 400:
-                    try:
-                        error_data = json.loads(response_text)
-                        error_message = error_data.get("error", {}).get("message", response_text)
-                    except json.JSONDecodeError:
-                        error_message = response_text
-                    
-                    _LOGGER.error("Azure Face API error: %s (status: %s)", error_message, response.status)
-                    raise AzureFaceAPIError(f"API error: {error_message}")
-
-                if response_text:
-                    return json.loads(response_text)
-                return {}
-
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Network error calling Azure Face API: %s", err)
-            raise AzureFaceAPIError(f"Network error: {err}")
+                    if retryable and attempt < MAX_RETRIES:
+                        delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                        _LOGGER.debug(
+                            "Azure Face API returned status %s, retrying in %.1fs",
+                            response.status,
+                            delay,
+                        )
+                    elif response.status == 401:
+                        raise AzureFaceAPIError(
+                            "Authentication failed. Please check your API key.",
+                            ERROR_AUTHENTICATION_FAILED
+                        )
+                    elif response.status == 429:
+                        raise AzureFaceAPIError(
+                            "API quota exceeded. Please wait before retrying.",
+                            ERROR_QUOTA_EXCEEDED
+                        )
+                    elif response.status >= 400:
+                        response_text = await response.text()
+                        try:
+                            error_data = orjson.loads(response_text)
+                            error_message = error_data.get("error", {}).get("message", response_text)
+                        except orjson.JSONDecodeError:
+                            error_message = response_text
+
+                        _LOGGER.error("Azure Face API error: %s (status: %s)", error_message, response.status)
+                        raise AzureFaceAPIError(f"API error: {error_message}")
+                    else:
+                        # Empty bodies (e.g. 202 from train) decode to None
+                        result = await response.json(loads=orjson.loads, content_type=None)
+                        return {} if result is None else result
+
+            except aiohttp.ClientError as err:
+                _LOGGER.error("Network error calling Azure Face API: %s", err)
+                raise AzureFaceAPIError(f"Network error: {err}")
+
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+        """Return how long to wait before retrying a throttled or failed request.
+
+        A server-supplied Retry-After is capped at RETRY_BACKOFF_CAP so a caller
+        holding the API semaphore or connection lock is never parked for long.
+        """
+        if retry_after:
+            try:
+                return min(RETRY_BACKOFF_CAP, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                wait = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                return min(RETRY_BACKOFF_CAP, max(0.0, wait))
+            except (TypeError, ValueError):
+                pass
+
+        backoff = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt)
+        return backoff + random.uniform(0, RETRY_BACKOFF_BASE)
+
+    async def _cached_get(self, url: str, ttl: float = DEFAULT_CACHE_TTL) -> Any:
+        """Make a GET request, reusing a recent response for the same URL."""
+        cached = self._get_cache.get(url)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        result = await self._make_request("GET", url)
+        self._get_cache[url] = (now, result)
+        return result
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached GET responses whose URL starts with the given prefix."""
+        if not prefix:
+            self._get_cache.clear()
+            return
+        for url in [url for url in self._get_cache if url.startswith(prefix)]:
+            del self._get_cache[url]
 
     async def detect_faces(self, image_data: bytes, detection_model: str = "detection_03") -> List[Dict[str, Any]]:
         """Detect faces in an image."""
@@ -121,25 +318,84 @@ class AzureFaceClient:
         response = await self._make_request("POST", url, data=image_data, params=params)
         return response
 
+    async def detect_faces_many(
+        self,
+        images: List[bytes],
+        detection_model: str = "detection_03",
+        concurrency: int = 5,
+    ) -> List[Union[List[Dict[str, Any]], AzureFaceAPIError]]:
+        """Detect faces in several images, running up to `concurrency` requests at once.
+
+        Results are returned in the same order as `images`. A failed image
+        (including a 429 throttle) yields its AzureFaceAPIError in place of
+        the face list instead of aborting the whole batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _detect(image_data: bytes) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.detect_faces(image_data, detection_model)
+
+        return await asyncio.gather(
+            *(_detect(image_data) for image_data in images), return_exceptions=True
+        )
+
     async def identify_faces(
         self,
         face_ids: List[str],
         person_group_id: str,
         max_candidates: int = 1,
         confidence_threshold: float = 0.5,
+        semaphore: Optional[asyncio.Semaphore] = None,
     ) -> List[Dict[str, Any]]:
-        """Identify faces using a person group."""
+        """Identify faces using a person group.
+
+        The API accepts at most MAX_FACES_PER_IDENTIFY face IDs per call, so
+        larger batches are split and identified concurrently. When a semaphore
+        is given, each request holds it, so the split never exceeds its bound.
+        """
         url = f"{self.endpoint}/face/v1.0/identify"
-        
-        data = {
-            "faceIds": face_ids,
-            "personGroupId": person_group_id,
-            "maxNumOfCandidatesReturned": max_candidates,
-            "confidenceThreshold": confidence_threshold,
-        }
 
-        response = await self._make_request("POST", url, data=data)
-        return response
+        async def _identify(batch: List[str]) -> List[Dict[str, Any]]:
+            data = {
+                "faceIds": batch,
+                "personGroupId": person_group_id,
+                "maxNumOfCandidatesReturned": max_candidates,
+                "confidenceThreshold": confidence_threshold,
+            }
+            async with semaphore or contextlib.nullcontext():
+                return await self._make_request("POST", url, data=data)
+
+        if len(face_ids) <= MAX_FACES_PER_IDENTIFY:
+            return await _identify(face_ids)
+
+        batches = await asyncio.gather(
+            *(
+                _identify(face_ids[i:i + MAX_FACES_PER_IDENTIFY])
+                for i in range(0, len(face_ids), MAX_FACES_PER_IDENTIFY)
+            )
+        )
+        return [identification for batch in batches for identification in batch]
+
+    async def identify_and_resolve(
+        self,
+        face_ids: List[str],
+        person_group_id: str,
+        max_candidates: int = 1,
+        confidence_threshold: float = 0.5,
+    ) -> List[Dict[str, Any]]:
+        """Identify faces and attach the matching person to each candidate."""
+        identifications, persons = await asyncio.gather(
+            self.identify_faces(face_ids, person_group_id, max_candidates, confidence_threshold),
+            self.list_persons(person_group_id),
+        )
+
+        persons_by_id = {person["personId"]: person for person in persons}
+        for identification in identifications:
+            for candidate in identification.get("candidates") or ():
+                candidate["person"] = persons_by_id.get(candidate["personId"])
+
+        return identifications
 
     async def create_person_group(
         self,
@@ -160,11 +416,13 @@ class AzureFaceClient:
             data["userData"] = user_data
 
         await self._make_request("PUT", url, data=data)
+        self.invalidate(f"{self.endpoint}/face/v1.0/persongroups")
 
     async def train_person_group(self, person_group_id: str) -> None:
         """Train a person group."""
         url = f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}/train"
         await self._make_request("POST", url)
+        self.invalidate(f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}")
 
     async def get_person_group_training_status(self, person_group_id: str) -> Dict[str, Any]:
         """Get the training status of a person group."""
@@ -182,7 +440,9 @@ class AzureFaceClient:
         if user_data:
             data["userData"] = user_data
 
-        return await self._make_request("POST", url, data=data)
+        result = await self._make_request("POST", url, data=data)
+        self.invalidate(f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}")
+        return result
 
     async def add_person_face(
         self,
@@ -201,49 +461,57 @@ class AzureFaceClient:
         # Validate image
         await self._validate_image(image_data)
         
-        return await self._make_request("POST", url, data=image_data, params=params)
+        result = await self._make_request("POST", url, data=image_data, params=params)
+        self.invalidate(f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}")
+        return result
 
     async def list_person_groups(self) -> List[Dict[str, Any]]:
         """List all person groups."""
         url = f"{self.endpoint}/face/v1.0/persongroups"
-        return await self._make_request("GET", url)
+        return await self._cached_get(url)
 
     async def get_person_group(self, person_group_id: str) -> Dict[str, Any]:
         """Get a person group."""
         url = f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}"
-        return await self._make_request("GET", url)
+        return await self._cached_get(url)
 
     async def list_persons(self, person_group_id: str) -> List[Dict[str, Any]]:
         """List persons in a person group."""
         url = f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}/persons"
-        return await self._make_request("GET", url)
+        return await self._cached_get(url)
 
     async def get_person(self, person_group_id: str, person_id: str) -> Dict[str, Any]:
         """Get a specific person from a person group."""
         url = f"{self.endpoint}/face/v1.0/persongroups/{person_group_id}/persons/{person_id}"
-        return await self._make_request("GET", url)
+        return await self._cached_get(url)
 
     async def _validate_image(self, image_data: bytes) -> None:
-        """Validate image data."""
+        """Validate image data without blocking the event loop."""
         if len(image_data) > MAX_IMAGE_SIZE:
             raise AzureFaceAPIError(
                 f"Image size exceeds maximum of {MAX_IMAGE_SIZE / (1024 * 1024):.1f}MB",
                 ERROR_INVALID_IMAGE
             )
 
+        # Fast path: recognise supported formats by their magic bytes inline;
+        # only the PIL fallback is slow enough to need the executor
+        if sniff_image_mime(image_data) is not None:
+            return
+
+        await self.hass.async_add_executor_job(self._validate_image_sync, image_data)
+
+    @staticmethod
+    def _validate_image_sync(image_data: bytes) -> None:
+        """Validate image data that the signature check did not recognise."""
+        # PIL is only needed here, so import it lazily to keep startup light
+        import io
+        from PIL import Image
+
         try:
-            # Validate image format using PIL
-            image = Image.open(io.BytesIO(image_data))
-            image.verify()
-            
-            # Check if image format is supported
-            mime_type = f"image/{image.format.lower()}"
-            if mime_type not in SUPPORTED_IMAGE_FORMATS:
-                raise AzureFaceAPIError(
-                    f"Unsupported image format: {image.format}. Supported formats: JPEG, PNG, BMP, GIF",
-                    ERROR_INVALID_IMAGE
-                )
-                
+            # Fall back to PIL for anything the signature check doesn't recognise.
+            # Opening only parses the header, which is all the format check needs.
+            with Image.open(io.BytesIO(image_data)) as image:
+                image_format = image.format
         except Exception as err:
             _LOGGER.error("Image validation failed: %s", err)
             raise AzureFaceAPIError(
@@ -251,6 +519,13 @@ class AzureFaceClient:
                 ERROR_INVALID_IMAGE
             ) from err
 
+        # Check if image format is supported
+        if f"image/{image_format.lower()}" not in SUPPORTED_IMAGE_FORMATS:
+            raise AzureFaceAPIError(
+                f"Unsupported image format: {image_format}. Supported formats: JPEG, PNG, BMP, GIF",
+                ERROR_INVALID_IMAGE
+            )
+
     async def test_connection(self) -> bool:
         """Test the connection to Azure Face API."""
         try:
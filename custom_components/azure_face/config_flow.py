@@ -1,6 +1,6 @@
 """Config flow for Azure Face integration."""
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 import voluptuous as vol
 
 from homeassistant import config_entries
@@ -16,11 +16,29 @@ from homeassistant.helpers.selector import (
     TextSelectorType,
 )
 
-from .const import DOMAIN, CONF_API_KEY, CONF_ENDPOINT, CONF_PERSON_GROUP_ID, AZURE_REGIONS
+from .const import (
+    DOMAIN,
+    CONF_API_KEY,
+    CONF_ENDPOINT,
+    CONF_FAST_MODE,
+    CONF_MAX_CONCURRENCY,
+    CONF_PERSON_GROUP_ID,
+    CONF_RESIZE_IMAGES,
+    DEFAULT_FAST_MODE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_RESIZE_IMAGES,
+    AZURE_REGIONS,
+)
 from .azure_client import AzureFaceClient, AzureFaceAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Region selector options, built once since AZURE_REGIONS is static
+_REGION_OPTIONS = [
+    {"value": region, "label": f"{region.title()} ({endpoint})"}
+    for region, endpoint in AZURE_REGIONS.items()
+] + [{"value": "custom", "label": "Custom endpoint"}]
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -38,16 +56,16 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
     api_key = data[CONF_API_KEY]
     endpoint = data[CONF_ENDPOINT]
 
-    client = AzureFaceClient(hass, endpoint, api_key)
-
-    try:
-        # Test the connection
-        if not await client.test_connection():
-            raise InvalidAuth
-    except AzureFaceAPIError as err:
-        if "authentication" in str(err).lower():
-            raise InvalidAuth from err
-        raise CannotConnect from err
+    # Use a short-lived client so clients shared by loaded entries are never touched
+    async with AzureFaceClient(hass, endpoint, api_key, dedicated_session=False) as client:
+        try:
+            # Test the connection
+            if not await client.test_connection():
+                raise InvalidAuth
+        except AzureFaceAPIError as err:
+            if "authentication" in str(err).lower():
+                raise InvalidAuth from err
+            raise CannotConnect from err
 
     # Return info that you want to store in the config entry.
     return {"title": f"Azure Face ({endpoint.split('//')[1].split('.')[0].title()})"}
@@ -61,6 +79,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
         self._data = {}
+        self._person_groups_cache: Optional[List[Dict[str, Any]]] = None
 
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
@@ -69,54 +88,51 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
 
         if user_input is not None:
-            # Handle region selection and endpoint
+            # Resolve the endpoint once; it is stored on self._data for later steps
             region = user_input.get("region")
             if region == "custom":
                 endpoint = user_input.get(CONF_ENDPOINT)
-                if not endpoint:
-                    errors["base"] = "missing_custom_endpoint"
-                    return self.async_show_form(
-                        step_id="user", data_schema=data_schema, errors=errors
-                    )
             else:
                 endpoint = AZURE_REGIONS.get(region)
-                if not endpoint:
-                    errors["base"] = "invalid_region"
-                    return self.async_show_form(
-                        step_id="user", data_schema=data_schema, errors=errors
-                    )
-            
-            # Create validation data with the correct endpoint
-            validation_data = {
-                CONF_API_KEY: user_input[CONF_API_KEY],
-                CONF_ENDPOINT: endpoint,
-            }
-            
-            try:
-                info = await validate_input(self.hass, validation_data)
-            except CannotConnect:
-                errors["base"] = "cannot_connect"
-            except InvalidAuth:
-                errors["base"] = "invalid_auth"
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+
+            if not endpoint:
+                errors["base"] = (
+                    "missing_custom_endpoint" if region == "custom" else "invalid_region"
+                )
             else:
+                # Create validation data with the correct endpoint
+                validation_data = {
+                    CONF_API_KEY: user_input[CONF_API_KEY],
+                    CONF_ENDPOINT: endpoint,
+                }
+
+                try:
+                    info = await validate_input(self.hass, validation_data)
+                except CannotConnect:
+                    errors["base"] = "cannot_connect"
+                except InvalidAuth:
+                    errors["base"] = "invalid_auth"
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Unexpected exception")
+                    errors["base"] = "unknown"
+
+            if not errors:
+                # Drop cached person groups if the credentials changed
+                if (
+                    self._data.get(CONF_ENDPOINT) != endpoint
+                    or self._data.get(CONF_API_KEY) != user_input[CONF_API_KEY]
+                ):
+                    self._person_groups_cache = None
+
                 # Store the data for the next step
                 self._data.update(user_input)
                 self._data[CONF_ENDPOINT] = endpoint
                 return await self.async_step_person_group()
 
         # Build the schema for region selection
-        region_options = [
-            {"value": region, "label": f"{region.title()} ({endpoint})"}
-            for region, endpoint in AZURE_REGIONS.items()
-        ]
-        region_options.append({"value": "custom", "label": "Custom endpoint"})
-
         data_schema = vol.Schema({
             vol.Required("region", default="eastus"): SelectSelector(
-                SelectSelectorConfig(options=region_options)
+                SelectSelectorConfig(options=_REGION_OPTIONS)
             ),
             vol.Optional(CONF_ENDPOINT): TextSelector(
                 TextSelectorConfig(type=TextSelectorType.URL)
@@ -153,20 +169,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 else:
                     # Try to create the person group
                     try:
-                        endpoint = self._data.get(CONF_ENDPOINT)
-                        if self._data.get("region") != "custom":
-                            endpoint = AZURE_REGIONS[self._data["region"]]
-                            
-                        client = AzureFaceClient(
-                            self.hass, endpoint, self._data[CONF_API_KEY]
-                        )
-                        await client.create_person_group(
-                            person_group_id,
-                            group_name,
-                            user_input.get("group_description"),
-                        )
+                        async with AzureFaceClient(
+                            self.hass,
+                            self._data[CONF_ENDPOINT],
+                            self._data[CONF_API_KEY],
+                            dedicated_session=False,
+                        ) as client:
+                            await client.create_person_group(
+                                person_group_id,
+                                group_name,
+                                user_input.get("group_description"),
+                            )
                         self._data[CONF_PERSON_GROUP_ID] = person_group_id
-                        self._data[CONF_ENDPOINT] = endpoint
                     except AzureFaceAPIError as err:
                         _LOGGER.error("Failed to create person group: %s", err)
                         errors["base"] = "cannot_create_group"
@@ -177,10 +191,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors["base"] = "missing_person_group_id"
                 else:
                     self._data[CONF_PERSON_GROUP_ID] = person_group_id
-                    endpoint = self._data.get(CONF_ENDPOINT)
-                    if self._data.get("region") != "custom":
-                        endpoint = AZURE_REGIONS[self._data["region"]]
-                    self._data[CONF_ENDPOINT] = endpoint
 
             if not errors:
                 return self.async_create_entry(
@@ -188,21 +198,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=self._data,
                 )
 
-        # Get existing person groups to offer as options
-        person_group_options = []
-        try:
-            endpoint = self._data.get(CONF_ENDPOINT)
-            if self._data.get("region") != "custom":
-                endpoint = AZURE_REGIONS[self._data["region"]]
-                
-            client = AzureFaceClient(self.hass, endpoint, self._data[CONF_API_KEY])
-            groups = await client.list_person_groups()
-            person_group_options = [
-                {"value": group["personGroupId"], "label": f"{group['name']} ({group['personGroupId']})"}
-                for group in groups
-            ]
-        except Exception as err:
-            _LOGGER.warning("Could not fetch existing person groups: %s", err)
+        # Get existing person groups to offer as options, fetched once per flow
+        if self._person_groups_cache is None:
+            try:
+                async with AzureFaceClient(
+                    self.hass,
+                    self._data[CONF_ENDPOINT],
+                    self._data[CONF_API_KEY],
+                    dedicated_session=False,
+                ) as client:
+                    self._person_groups_cache = await client.list_person_groups()
+            except Exception as err:
+                _LOGGER.warning("Could not fetch existing person groups: %s", err)
+
+        person_group_options = [
+            {"value": group["personGroupId"], "label": f"{group['name']} ({group['personGroupId']})"}
+            for group in self._person_groups_cache or []
+        ]
 
         data_schema = vol.Schema({
             vol.Optional("create_new_group", default=True): bool,
@@ -280,6 +292,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     ]
                 )
             ),
+            vol.Optional(
+                CONF_RESIZE_IMAGES,
+                default=self.config_entry.options.get(CONF_RESIZE_IMAGES, DEFAULT_RESIZE_IMAGES),
+            ): bool,
+            vol.Optional(
+                CONF_FAST_MODE,
+                default=self.config_entry.options.get(CONF_FAST_MODE, DEFAULT_FAST_MODE),
+            ): bool,
+            vol.Optional(
+                CONF_MAX_CONCURRENCY,
+                default=self.config_entry.options.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
         })
 
         return self.async_show_form(
@@ -1,4 +1,6 @@
 """Constants for the Azure Face integration."""
+from types import MappingProxyType
+
 import voluptuous as vol
 from homeassistant.helpers import config_validation as cv
 
@@ -9,6 +11,12 @@ CONF_API_KEY = "api_key"
 CONF_ENDPOINT = "endpoint"
 CONF_PERSON_GROUP_ID = "person_group_id"
 CONF_CAMERA_ENTITY = "camera_entity"
+CONF_RESIZE_IMAGES = "resize_images"
+CONF_FAST_MODE = "fast_mode"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+
+# Keys in hass.data[DOMAIN] that are not config entry IDs
+DATA_FIRST_ENTRY = "__first__"
 
 # Service names
 SERVICE_RECOGNIZE_FACE = "recognize_face"
@@ -20,14 +28,41 @@ SERVICE_UPLOAD_PERSON_IMAGE = "upload_person_image"
 SERVICE_GET_TRAINING_STATUS = "get_training_status"
 SERVICE_LIST_PERSONS = "list_persons"
 
+# Event types
+EVENT_RECOGNITION_RESULT = f"{DOMAIN}_recognition_result"
+EVENT_TRAINING_RESULT = f"{DOMAIN}_training_result"
+EVENT_TRAINING_PROGRESS = f"{DOMAIN}_training_progress"
+EVENT_GROUP_MANAGEMENT = f"{DOMAIN}_group_management"
+EVENT_PERSON_MANAGEMENT = f"{DOMAIN}_person_management"
+EVENT_TRAINING_STATUS = f"{DOMAIN}_training_status"
+EVENT_PERSONS_LIST = f"{DOMAIN}_persons_list"
+
 # Default values
 DEFAULT_TIMEOUT = 10
+DEFAULT_CACHE_TTL = 10  # Seconds to reuse GET responses from the Face API
+CONNECTOR_LIMIT = 20  # Max open connections for the client's own session
+CONNECTOR_LIMIT_PER_HOST = 10
+DNS_CACHE_TTL = 300  # Seconds
 DEFAULT_CONFIDENCE_THRESHOLD = 0.7
+MAX_RETRIES = 3  # Retries on 429/5xx responses
+DEFAULT_MAX_CONCURRENCY = 10  # API calls per entry, keeps bursts under the Face API rate limit
+TRAINING_DOWNLOAD_CONCURRENCY = 5  # Training images fetched at once per service call
+RETRY_BACKOFF_BASE = 0.5  # Seconds
+RETRY_BACKOFF_CAP = 8.0  # Seconds
+TRAINING_POLL_TIMEOUT = 600  # Seconds to wait for a group to finish training
+TRAINING_POLL_MAX_INTERVAL = 15.0  # Seconds between training status polls
 MAX_IMAGE_SIZE = 6 * 1024 * 1024  # 6MB
-SUPPORTED_IMAGE_FORMATS = ["image/jpeg", "image/png", "image/bmp", "image/gif"]
+MAX_FACES_PER_IDENTIFY = 10  # Face API limit on faceIds per identify call
+DEFAULT_RESIZE_IMAGES = True
+DEFAULT_FAST_MODE = False
+RESIZE_THRESHOLD = 1_000_000  # Camera images above this many bytes are downscaled
+RESIZE_MAX_DIMENSION = 1920  # Pixels on the long edge after downscaling
+RECOGNITION_CACHE_TTL = 5.0  # Seconds to reuse results for an identical frame
+RECOGNITION_CACHE_SIZE = 16  # Recent frames remembered
+SUPPORTED_IMAGE_FORMATS = frozenset({"image/jpeg", "image/png", "image/bmp", "image/gif"})
 
 # Azure Face API endpoints
-AZURE_REGIONS = {
+AZURE_REGIONS = MappingProxyType({
     "eastus": "https://eastus.api.cognitive.microsoft.com",
     "eastus2": "https://eastus2.api.cognitive.microsoft.com",
     "westus": "https://westus.api.cognitive.microsoft.com",
@@ -36,7 +71,7 @@ AZURE_REGIONS = {
     "northeurope": "https://northeurope.api.cognitive.microsoft.com",
     "southeastasia": "https://southeastasia.api.cognitive.microsoft.com",
     "eastasia": "https://eastasia.api.cognitive.microsoft.com",
-}
+})
 
 # Service schemas
 SERVICE_RECOGNIZE_FACE_SCHEMA = vol.Schema({
@@ -44,13 +79,18 @@ SERVICE_RECOGNIZE_FACE_SCHEMA = vol.Schema({
     vol.Optional("confidence_threshold", default=DEFAULT_CONFIDENCE_THRESHOLD): vol.All(
         vol.Coerce(float), vol.Range(min=0.0, max=1.0)
     ),
+    vol.Optional("force", default=False): cv.boolean,
 })
 
-SERVICE_TRAIN_PERSON_SCHEMA = vol.Schema({
-    vol.Required("person_id"): cv.string,
-    vol.Required("image_url"): cv.url,
-    vol.Optional("detection_model", default="detection_03"): cv.string,
-})
+SERVICE_TRAIN_PERSON_SCHEMA = vol.All(
+    vol.Schema({
+        vol.Required("person_id"): cv.string,
+        vol.Optional("image_url"): cv.url,
+        vol.Optional("image_urls"): vol.All(cv.ensure_list, [cv.url]),
+        vol.Optional("detection_model", default="detection_03"): cv.string,
+    }),
+    cv.has_at_least_one_key("image_url", "image_urls"),
+)
 
 SERVICE_CREATE_PERSON_GROUP_SCHEMA = vol.Schema({
     vol.Required(CONF_PERSON_GROUP_ID): cv.string,
@@ -89,7 +129,6 @@ SERVICE_LIST_PERSONS_SCHEMA = vol.Schema({
 # Error codes
 ERROR_INVALID_IMAGE = "invalid_image"
 ERROR_NO_FACE_DETECTED = "no_face_detected"
-ERROR_MULTIPLE_FACES = "multiple_faces"
 ERROR_API_ERROR = "api_error"
 ERROR_PERSON_GROUP_NOT_FOUND = "person_group_not_found"
 ERROR_QUOTA_EXCEEDED = "quota_exceeded"
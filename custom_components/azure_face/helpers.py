@@ -1,43 +1,65 @@
 """Helper functions for the Azure Face integration."""
+import asyncio
+from typing import Any, Dict, Optional
+
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .azure_client import AzureFaceClient
-from .const import DOMAIN
+from .const import DATA_FIRST_ENTRY, DOMAIN
 
+# Resolved entry data per entry_id; None is the first entry
+_RESOLVED: Dict[Optional[str], Dict[str, Any]] = {}
 
-async def get_azure_face_client(hass: HomeAssistant, entry_id: str = None) -> AzureFaceClient:
-    """Get Azure Face client from the first available entry or specified entry."""
-    if not hass.data.get(DOMAIN):
+
+def _resolve_entry(hass: HomeAssistant, entry_id: Optional[str]) -> Dict[str, Any]:
+    """Return the stored data for an entry, resolving and caching it on first use."""
+    entry_data = _RESOLVED.get(entry_id)
+    if entry_data is not None:
+        return entry_data
+
+    domain_data = hass.data.get(DOMAIN)
+    if not domain_data:
         raise ValueError("Azure Face integration not set up")
     
     if entry_id:
-        if entry_id not in hass.data[DOMAIN]:
+        if entry_id not in domain_data:
             raise ValueError(f"Azure Face entry {entry_id} not found")
-        return hass.data[DOMAIN][entry_id]["client"]
-    
-    # Get the first available entry
-    entries = hass.data[DOMAIN]
-    if not entries:
-        raise ValueError("No Azure Face entries configured")
-    
-    first_entry = next(iter(entries.values()))
-    return first_entry["client"]
+        entry_data = domain_data[entry_id]
+    else:
+        # Get the first available entry
+        first_id = domain_data.get(DATA_FIRST_ENTRY)
+        if first_id is None:
+            raise ValueError("No Azure Face entries configured")
+        entry_data = domain_data[first_id]
 
+    _RESOLVED[entry_id] = entry_data
+    return entry_data
 
-async def get_person_group_id(hass: HomeAssistant, entry_id: str = None) -> str:
+
+def get_azure_face_client(hass: HomeAssistant, entry_id: Optional[str] = None) -> AzureFaceClient:
+    """Get Azure Face client from the first available entry or specified entry."""
+    return _resolve_entry(hass, entry_id)["client"]
+
+
+def get_person_group_id(hass: HomeAssistant, entry_id: Optional[str] = None) -> str:
     """Get person group ID from the first available entry or specified entry."""
-    if not hass.data.get(DOMAIN):
-        raise ValueError("Azure Face integration not set up")
-    
-    if entry_id:
-        if entry_id not in hass.data[DOMAIN]:
-            raise ValueError(f"Azure Face entry {entry_id} not found")
-        return hass.data[DOMAIN][entry_id]["person_group_id"]
-    
-    # Get the first available entry
-    entries = hass.data[DOMAIN]
-    if not entries:
-        raise ValueError("No Azure Face entries configured")
-    
-    first_entry = next(iter(entries.values()))
-    return first_entry["person_group_id"]
\ No newline at end of file
+    return _resolve_entry(hass, entry_id)["person_group_id"]
+
+
+def get_api_semaphore(hass: HomeAssistant, entry_id: Optional[str] = None) -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent Azure Face API calls for an entry."""
+    return _resolve_entry(hass, entry_id)["api_semaphore"]
+
+
+def get_config_entry(hass: HomeAssistant, entry_id: Optional[str] = None) -> ConfigEntry:
+    """Get the config entry for the first available entry or specified entry."""
+    return _resolve_entry(hass, entry_id)["config"]
+
+
+def invalidate(entry_id: Optional[str] = None) -> None:
+    """Forget resolved entries; clears everything when no entry_id is given."""
+    if entry_id is None:
+        _RESOLVED.clear()
+    else:
+        _RESOLVED.pop(entry_id, None)
@@ -1,19 +1,30 @@
 """Services for the Azure Face integration."""
 import asyncio
-import base64
-import io
+from collections import OrderedDict
+import functools
+import hashlib
 import logging
-from typing import Any, Dict
+import os
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple
 import aiohttp
+import pybase64
 
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.components.camera import async_get_image
 
-from .azure_client import AzureFaceAPIError
+from .azure_client import AzureFaceAPIError, sniff_image_mime
 from .const import (
     DOMAIN,
+    DEFAULT_TIMEOUT,
+    MAX_IMAGE_SIZE,
+    TRAINING_POLL_MAX_INTERVAL,
+    TRAINING_POLL_TIMEOUT,
+    TRAINING_DOWNLOAD_CONCURRENCY,
     SERVICE_RECOGNIZE_FACE,
     SERVICE_TRAIN_PERSON,
     SERVICE_CREATE_PERSON_GROUP,
@@ -30,318 +41,410 @@ from .const import (
     SERVICE_UPLOAD_PERSON_IMAGE_SCHEMA,
     SERVICE_GET_TRAINING_STATUS_SCHEMA,
     SERVICE_LIST_PERSONS_SCHEMA,
+    EVENT_RECOGNITION_RESULT,
+    EVENT_TRAINING_RESULT,
+    EVENT_TRAINING_PROGRESS,
+    EVENT_GROUP_MANAGEMENT,
+    EVENT_PERSON_MANAGEMENT,
+    EVENT_TRAINING_STATUS,
+    EVENT_PERSONS_LIST,
     CONF_CAMERA_ENTITY,
     CONF_PERSON_GROUP_ID,
+    CONF_RESIZE_IMAGES,
+    DEFAULT_RESIZE_IMAGES,
+    RECOGNITION_CACHE_SIZE,
+    RECOGNITION_CACHE_TTL,
+    RESIZE_MAX_DIMENSION,
+    RESIZE_THRESHOLD,
+    ERROR_INVALID_IMAGE,
     ERROR_NO_FACE_DETECTED,
-    ERROR_MULTIPLE_FACES,
 )
-from .helpers import get_azure_face_client, get_person_group_id
+from .helpers import (
+    get_api_semaphore,
+    get_azure_face_client,
+    get_config_entry,
+    get_person_group_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT, sock_connect=5, sock_read=10)
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_SNIFF_SIZE = 8  # Bytes needed to recognise every supported image signature
+
+# Service handler that fills in the event payload it is given
+_EventHandler = Callable[[ServiceCall, Dict[str, Any]], Awaitable[None]]
+
+
+async def _async_download_image(hass: HomeAssistant, image_url: str) -> bytes:
+    """Download an image using Home Assistant's shared, keep-alive session."""
+    session = async_get_clientsession(hass)
+    async with session.get(image_url, timeout=_DOWNLOAD_TIMEOUT) as response:
+        if response.status != 200:
+            raise HomeAssistantError(f"Failed to download image from {image_url}")
+
+        # Skip the download entirely when the server already reports an oversized body
+        if response.content_length is not None and response.content_length > MAX_IMAGE_SIZE:
+            raise AzureFaceAPIError(
+                f"Image at {image_url} exceeds maximum of {MAX_IMAGE_SIZE / (1024 * 1024):.1f}MB",
+                ERROR_INVALID_IMAGE,
+            )
+
+        # Stream the body so oversized images and non-images are abandoned early.
+        # The leading bytes are trusted over Content-Type, which servers such as
+        # S3 often report generically (e.g. binary/octet-stream).
+        buffer = bytearray()
+        sniffed = False
+        async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+            buffer.extend(chunk)
+            if not sniffed and len(buffer) >= _SNIFF_SIZE:
+                sniffed = True
+                _check_image_signature(buffer, image_url)
+            if len(buffer) > MAX_IMAGE_SIZE:
+                raise AzureFaceAPIError(
+                    f"Image at {image_url} exceeds maximum of {MAX_IMAGE_SIZE / (1024 * 1024):.1f}MB",
+                    ERROR_INVALID_IMAGE,
+                )
+        if not sniffed:
+            _check_image_signature(buffer, image_url)
+        return bytes(buffer)
+
+
+def _check_image_signature(image_data: bytes, image_url: str) -> None:
+    """Reject downloaded data that does not start like a supported image."""
+    if sniff_image_mime(image_data) is None:
+        raise AzureFaceAPIError(
+            f"URL {image_url} did not return a supported image (JPEG, PNG, BMP, GIF)",
+            ERROR_INVALID_IMAGE,
+        )
+
+
+def _read_image_file(image_path: str) -> bytes:
+    """Read an image file, refusing files larger than the Azure limit."""
+    if os.stat(image_path).st_size > MAX_IMAGE_SIZE:
+        raise AzureFaceAPIError(
+            f"Image size exceeds maximum of {MAX_IMAGE_SIZE / (1024 * 1024):.1f}MB",
+            ERROR_INVALID_IMAGE,
+        )
+    with open(image_path, "rb") as f:
+        return f.read()
+
+
+def _frame_digest(image_data: bytes) -> bytes:
+    """Return a short content hash used to spot repeated camera frames."""
+    return hashlib.blake2b(image_data, digest_size=16).digest()
+
+
+def _downscale_image(image_data: bytes, max_dimension: int) -> bytes:
+    """Shrink an image to fit within max_dimension pixels and re-encode it as JPEG."""
+    import io
+    from PIL import Image
+
+    with Image.open(io.BytesIO(image_data)) as image:
+        if max(image.size) <= max_dimension:
+            return image_data
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        output = io.BytesIO()
+        image.convert("RGB").save(output, format="JPEG", quality=85)
+    return output.getvalue()
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up the Azure Face services."""
-    
-    async def async_recognize_face(call: ServiceCall) -> None:
+
+async def async_setup_services(hass: HomeAssistant, fast_mode: bool = False) -> None:
+    """Set up the Azure Face services.
+
+    In fast mode the services are registered without schemas, skipping
+    validation of every call. Malformed calls then fail inside the handler
+    (e.g. with a missing-key error) instead of being rejected up front.
+    """
+    # Recent recognition results keyed by (frame digest, confidence threshold)
+    recent_results: "OrderedDict[Tuple[bytes, float], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _api_service(
+        event_type: str, description: str
+    ) -> Callable[[_EventHandler], Callable[[ServiceCall], Awaitable[None]]]:
+        """Wrap a handler with the shared event firing and error handling.
+
+        The handler fills in the event payload it is given. The payload is
+        fired as `event_type` once the handler returns, or with an `error`
+        field if the Azure Face API call fails.
+        """
+
+        def decorator(handler: _EventHandler) -> Callable[[ServiceCall], Awaitable[None]]:
+            @functools.wraps(handler)
+            async def wrapper(call: ServiceCall) -> None:
+                event: Dict[str, Any] = {}
+                try:
+                    await handler(call, event)
+                except AzureFaceAPIError as err:
+                    _LOGGER.error("Azure Face API error during %s: %s", description.lower(), err)
+                    event["error"] = str(err)
+                    hass.bus.async_fire(event_type, event)
+                    raise HomeAssistantError(f"Azure Face API error: {err}") from err
+                except HomeAssistantError:
+                    raise
+                except (aiohttp.ClientError, asyncio.TimeoutError, OSError, ValueError, KeyError) as err:
+                    # Cancellation is a BaseException and unwinds past this untouched
+                    _LOGGER.error("Error during %s: %s", description.lower(), err)
+                    raise HomeAssistantError(f"{description} failed: {err}") from err
+
+                hass.bus.async_fire(event_type, event)
+
+            return wrapper
+
+        return decorator
+
+    @_api_service(EVENT_RECOGNITION_RESULT, "Face recognition")
+    async def async_recognize_face(call: ServiceCall, event: Dict[str, Any]) -> None:
         """Recognize faces in camera image."""
         camera_entity = call.data[CONF_CAMERA_ENTITY]
         confidence_threshold = call.data.get("confidence_threshold", 0.7)
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            person_group_id = await get_person_group_id(hass)
-            
-            # Get image from camera
-            image_data = await async_get_image(hass, camera_entity)
-            if not image_data:
-                raise HomeAssistantError(f"Could not get image from camera {camera_entity}")
-            
-            # Detect faces
-            faces = await client.detect_faces(image_data.content)
-            
-            if not faces:
-                _LOGGER.warning("No faces detected in image")
-                hass.bus.async_fire(
-                    f"{DOMAIN}_recognition_result",
-                    {
-                        "camera_entity": camera_entity,
-                        "faces_detected": 0,
-                        "identifications": [],
-                        "error": ERROR_NO_FACE_DETECTED,
-                    },
-                )
-                return
-            
-            if len(faces) > 1:
-                _LOGGER.warning("Multiple faces detected in image")
-                hass.bus.async_fire(
-                    f"{DOMAIN}_recognition_result",
-                    {
-                        "camera_entity": camera_entity,
-                        "faces_detected": len(faces),
-                        "identifications": [],
-                        "error": ERROR_MULTIPLE_FACES,
-                    },
-                )
-                return
-            
-            # Extract face IDs
-            face_ids = [face["faceId"] for face in faces]
-            
-            # Identify faces
-            identifications = await client.identify_faces(
-                face_ids, person_group_id, confidence_threshold=confidence_threshold
+        force = call.data.get("force", False)
+        event.update(camera_entity=camera_entity, faces_detected=0, identifications=[])
+
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+        person_group_id = get_person_group_id(hass)
+
+        # Get image from camera
+        image_data = await async_get_image(hass, camera_entity)
+        if not image_data:
+            raise HomeAssistantError(f"Could not get image from camera {camera_entity}")
+
+        # Reuse the result for a frame identical to one recognized moments ago
+        digest = await hass.async_add_executor_job(_frame_digest, image_data.content)
+        cache_key = (digest, confidence_threshold)
+        cached = recent_results.get(cache_key)
+        if not force and cached is not None and time.monotonic() - cached[0] < RECOGNITION_CACHE_TTL:
+            event.update(cached[1])
+            _LOGGER.debug("Reusing recognition result for unchanged frame from %s", camera_entity)
+            return
+
+        # Downscale large snapshots to cut upload time
+        image_content = image_data.content
+        resize_images = get_config_entry(hass).options.get(
+            CONF_RESIZE_IMAGES, DEFAULT_RESIZE_IMAGES
+        )
+        if resize_images and len(image_content) > RESIZE_THRESHOLD:
+            image_content = await hass.async_add_executor_job(
+                _downscale_image, image_content, RESIZE_MAX_DIMENSION
             )
-            
-            # Process results
-            results = []
-            for i, identification in enumerate(identifications):
-                face_data = faces[i]
-                result = {
-                    "face_id": identification["faceId"],
-                    "face_attributes": face_data.get("faceAttributes", {}),
-                    "candidates": [],
-                }
-                
-                for candidate in identification.get("candidates", []):
-                    result["candidates"].append({
+
+        # Detect faces
+        async with api_semaphore:
+            faces = await client.detect_faces(image_content)
+
+        if not faces:
+            _LOGGER.warning("No faces detected in image")
+            event["error"] = ERROR_NO_FACE_DETECTED
+            return
+
+        # Index faces by ID to match them with their identifications
+        face_by_id = {face["faceId"]: face for face in faces}
+        face_ids = list(face_by_id)
+
+        # Identify faces; each identify request takes its own semaphore slot
+        identifications = await client.identify_faces(
+            face_ids,
+            person_group_id,
+            confidence_threshold=confidence_threshold,
+            semaphore=api_semaphore,
+        )
+
+        # Process results
+        results = [
+            {
+                "face_id": identification["faceId"],
+                "face_attributes": face_by_id[identification["faceId"]].get("faceAttributes", {}),
+                "candidates": [
+                    {
                         "person_id": candidate["personId"],
                         "confidence": candidate["confidence"],
-                    })
-                
-                results.append(result)
-            
-            # Fire event with results
-            hass.bus.async_fire(
-                f"{DOMAIN}_recognition_result",
-                {
-                    "camera_entity": camera_entity,
-                    "faces_detected": len(faces),
-                    "identifications": results,
-                },
-            )
-            
+                    }
+                    for candidate in identification.get("candidates") or ()
+                ],
+            }
+            for identification in identifications
+        ]
+
+        event["faces_detected"] = len(faces)
+        event["identifications"] = results
+
+        recent_results[cache_key] = (
+            time.monotonic(),
+            {"faces_detected": len(faces), "identifications": results},
+        )
+        recent_results.move_to_end(cache_key)
+        while len(recent_results) > RECOGNITION_CACHE_SIZE:
+            recent_results.popitem(last=False)
+
+        if _LOGGER.isEnabledFor(logging.INFO):
             _LOGGER.info(
                 "Face recognition completed for %s. Detected %d faces, identified %d candidates",
                 camera_entity,
                 len(faces),
                 sum(len(r["candidates"]) for r in results),
             )
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error during recognition: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_recognition_result",
-                {
-                    "camera_entity": camera_entity,
-                    "faces_detected": 0,
-                    "identifications": [],
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error during face recognition: %s", err)
-            raise HomeAssistantError(f"Face recognition failed: {err}") from err
-
-    async def async_train_person(call: ServiceCall) -> None:
-        """Add training image for a person."""
+
+    @_api_service(EVENT_TRAINING_RESULT, "Person training")
+    async def async_train_person(call: ServiceCall, event: Dict[str, Any]) -> None:
+        """Add training images for a person."""
         person_id = call.data["person_id"]
-        image_url = call.data["image_url"]
+        image_urls = call.data.get("image_urls", ())
+        # Fast mode skips cv.ensure_list, so a single URL may arrive as a plain string
+        image_urls = [image_urls] if isinstance(image_urls, str) else list(image_urls)
+        if call.data.get("image_url"):
+            image_urls.insert(0, call.data["image_url"])
         detection_model = call.data.get("detection_model", "detection_03")
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            person_group_id = await get_person_group_id(hass)
-            
-            # Download image from URL
-            async with aiohttp.ClientSession() as session:
-                async with session.get(image_url) as response:
-                    if response.status != 200:
-                        raise HomeAssistantError(f"Failed to download image from {image_url}")
-                    image_data = await response.read()
-            
-            # Add face to person
-            result = await client.add_person_face(
-                person_group_id, person_id, image_data, detection_model
-            )
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_training_result",
-                {
-                    "person_id": person_id,
-                    "persisted_face_id": result["persistedFaceId"],
-                    "action": "face_added",
-                },
-            )
-            
-            _LOGGER.info("Successfully added training face for person %s", person_id)
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error during training: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_training_result",
-                {
-                    "person_id": person_id,
-                    "action": "face_added",
-                    "error": str(err),
-                },
+        if not image_urls:
+            raise HomeAssistantError("Must provide either image_url or image_urls")
+        event.update(person_id=person_id, action="face_added")
+
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+        person_group_id = get_person_group_id(hass)
+        download_slots = asyncio.Semaphore(TRAINING_DOWNLOAD_CONCURRENCY)
+
+        async def _add_face(image_url: str) -> str:
+            """Download one image and add it to the person."""
+            async with download_slots:
+                image_data = await _async_download_image(hass, image_url)
+                async with api_semaphore:
+                    result = await client.add_person_face(
+                        person_group_id, person_id, image_data, detection_model
+                    )
+            return result["persistedFaceId"]
+
+        # Download and upload the images concurrently
+        results = await asyncio.gather(
+            *(_add_face(image_url) for image_url in image_urls), return_exceptions=True
+        )
+        persisted_face_ids = [r for r in results if not isinstance(r, BaseException)]
+        failures = [
+            (image_url, r) for image_url, r in zip(image_urls, results) if isinstance(r, BaseException)
+        ]
+        if not persisted_face_ids:
+            raise failures[0][1]
+
+        event["persisted_face_id"] = persisted_face_ids[0]
+        event["persisted_face_ids"] = persisted_face_ids
+        if failures:
+            event["failed_images"] = [
+                {"image_url": image_url, "error": str(err)} for image_url, err in failures
+            ]
+            _LOGGER.warning(
+                "Failed to add %d of %d training images for person %s",
+                len(failures),
+                len(image_urls),
+                person_id,
             )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error during person training: %s", err)
-            raise HomeAssistantError(f"Person training failed: {err}") from err
 
-    async def async_create_person_group(call: ServiceCall) -> None:
+        _LOGGER.info(
+            "Successfully added %d training faces for person %s", len(persisted_face_ids), person_id
+        )
+
+    @_api_service(EVENT_GROUP_MANAGEMENT, "Group creation")
+    async def async_create_person_group(call: ServiceCall, event: Dict[str, Any]) -> None:
         """Create a new person group."""
         person_group_id = call.data[CONF_PERSON_GROUP_ID]
         name = call.data["name"]
         user_data = call.data.get("user_data")
         recognition_model = call.data.get("recognition_model", "recognition_04")
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            
-            # Create person group
+        event.update(person_group_id=person_group_id, action="group_created")
+
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+
+        # Create person group
+        async with api_semaphore:
             await client.create_person_group(
                 person_group_id, name, user_data, recognition_model
             )
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_group_management",
-                {
-                    "person_group_id": person_group_id,
-                    "action": "group_created",
-                    "name": name,
-                },
-            )
-            
-            _LOGGER.info("Successfully created person group %s", person_group_id)
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error during group creation: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_group_management",
-                {
-                    "person_group_id": person_group_id,
-                    "action": "group_created",
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error during group creation: %s", err)
-            raise HomeAssistantError(f"Group creation failed: {err}") from err
+        event["name"] = name
 
-    async def async_train_group(call: ServiceCall) -> None:
+        _LOGGER.info("Successfully created person group %s", person_group_id)
+
+    @_api_service(EVENT_TRAINING_RESULT, "Group training")
+    async def async_train_group(call: ServiceCall, event: Dict[str, Any]) -> None:
         """Train a person group."""
         person_group_id = call.data[CONF_PERSON_GROUP_ID]
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            
-            # Start training
+        event.update(person_group_id=person_group_id, action="group_trained")
+
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+
+        # Start training
+        async with api_semaphore:
             await client.train_person_group(person_group_id)
-            
-            # Monitor training status
+
+        async def _poll_until_done() -> None:
+            """Poll training status, backing off between polls and reporting progress."""
+            started = time.monotonic()
+            delay = 1.0
             while True:
-                status = await client.get_person_group_training_status(person_group_id)
+                async with api_semaphore:
+                    status = await client.get_person_group_training_status(person_group_id)
                 training_status = status["status"]
-                
+
                 if training_status == "succeeded":
-                    break
+                    return
                 elif training_status == "failed":
                     error_message = status.get("message", "Training failed")
                     raise HomeAssistantError(f"Training failed: {error_message}")
-                
+
+                # Let UIs show that training is still going
+                hass.bus.async_fire(
+                    EVENT_TRAINING_PROGRESS,
+                    {
+                        "person_group_id": person_group_id,
+                        "status": training_status,
+                        "elapsed": round(time.monotonic() - started),
+                    },
+                )
+
                 # Wait before checking again
-                await asyncio.sleep(1)
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_training_result",
-                {
-                    "person_group_id": person_group_id,
-                    "action": "group_trained",
-                    "status": "succeeded",
-                },
-            )
-            
-            _LOGGER.info("Successfully trained person group %s", person_group_id)
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error during group training: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_training_result",
-                {
-                    "person_group_id": person_group_id,
-                    "action": "group_trained",
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error during group training: %s", err)
-            raise HomeAssistantError(f"Group training failed: {err}") from err
+                await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+                delay = min(delay * 2, TRAINING_POLL_MAX_INTERVAL)
 
-    async def async_create_person(call: ServiceCall) -> None:
+        # Monitor training status; cancelling the service call stops polling
+        try:
+            await asyncio.wait_for(_poll_until_done(), TRAINING_POLL_TIMEOUT)
+        except asyncio.TimeoutError as err:
+            raise HomeAssistantError("Training polling timed out") from err
+
+        event["status"] = "succeeded"
+
+        # Results from before training may no longer be accurate
+        recent_results.clear()
+
+        _LOGGER.info("Successfully trained person group %s", person_group_id)
+
+    @_api_service(EVENT_PERSON_MANAGEMENT, "Person creation")
+    async def async_create_person(call: ServiceCall, event: Dict[str, Any]) -> None:
         """Create a new person in the person group."""
         name = call.data["name"]
         user_data = call.data.get("user_data")
         person_group_id = call.data.get(CONF_PERSON_GROUP_ID)
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            if not person_group_id:
-                person_group_id = await get_person_group_id(hass)
-            
-            # Create person
+        event.update(person_group_id=person_group_id, name=name, action="person_created")
+
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+        if not person_group_id:
+            person_group_id = event["person_group_id"] = get_person_group_id(hass)
+
+        # Create person
+        async with api_semaphore:
             result = await client.create_person(person_group_id, name, user_data)
-            person_id = result["personId"]
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_person_management",
-                {
-                    "person_group_id": person_group_id,
-                    "person_id": person_id,
-                    "name": name,
-                    "action": "person_created",
-                },
-            )
-            
-            _LOGGER.info("Successfully created person %s with ID %s", name, person_id)
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error during person creation: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_person_management",
-                {
-                    "person_group_id": person_group_id,
-                    "name": name,
-                    "action": "person_created",
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error during person creation: %s", err)
-            raise HomeAssistantError(f"Person creation failed: {err}") from err
+        person_id = event["person_id"] = result["personId"]
 
-    async def async_upload_person_image(call: ServiceCall) -> None:
+        _LOGGER.info("Successfully created person %s with ID %s", name, person_id)
+
+    @_api_service(EVENT_PERSON_MANAGEMENT, "Image upload")
+    async def async_upload_person_image(call: ServiceCall, event: Dict[str, Any]) -> None:
         """Upload an image for a person with multiple input methods."""
         person_id = call.data["person_id"]
         image_data_b64 = call.data.get("image_data")
@@ -349,212 +452,118 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         image_url = call.data.get("image_url")
         detection_model = call.data.get("detection_model", "detection_03")
         person_group_id = call.data.get(CONF_PERSON_GROUP_ID)
-        
-        if not any([image_data_b64, image_path, image_url]):
+
+        if not (image_data_b64 or image_path or image_url):
             raise HomeAssistantError("Must provide either image_data, image_path, or image_url")
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            if not person_group_id:
-                person_group_id = await get_person_group_id(hass)
-            
-            # Get image data based on input method
-            image_data = None
-            
-            if image_data_b64:
-                # Base64 encoded image data
-                try:
-                    image_data = base64.b64decode(image_data_b64)
-                except Exception as err:
-                    raise HomeAssistantError(f"Invalid base64 image data: {err}") from err
-                    
-            elif image_path:
-                # Read image from file path
-                try:
-                    with open(image_path, "rb") as f:
-                        image_data = f.read()
-                except Exception as err:
-                    raise HomeAssistantError(f"Failed to read image file {image_path}: {err}") from err
-                    
-            elif image_url:
-                # Download image from URL (existing functionality)
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(image_url) as response:
-                        if response.status != 200:
-                            raise HomeAssistantError(f"Failed to download image from {image_url}")
-                        image_data = await response.read()
-            
-            # Add face to person
+
+        event.update(person_group_id=person_group_id, person_id=person_id, action="image_uploaded")
+
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+        if not person_group_id:
+            person_group_id = event["person_group_id"] = get_person_group_id(hass)
+
+        # Get image data based on input method
+        image_data = None
+
+        if image_data_b64:
+            # Base64 encoded image data
+            try:
+                image_data = pybase64.b64decode(image_data_b64, validate=False)
+            except Exception as err:
+                raise HomeAssistantError(f"Invalid base64 image data: {err}") from err
+            if len(image_data) > MAX_IMAGE_SIZE:
+                raise AzureFaceAPIError(
+                    f"Image size exceeds maximum of {MAX_IMAGE_SIZE / (1024 * 1024):.1f}MB",
+                    ERROR_INVALID_IMAGE,
+                )
+
+        elif image_path:
+            # Read image from file path
+            try:
+                image_data = await hass.async_add_executor_job(_read_image_file, image_path)
+            except AzureFaceAPIError:
+                raise
+            except Exception as err:
+                raise HomeAssistantError(f"Failed to read image file {image_path}: {err}") from err
+
+        elif image_url:
+            # Download image from URL (existing functionality)
+            image_data = await _async_download_image(hass, image_url)
+
+        # Reject unsupported formats before paying for an Azure round-trip
+        if sniff_image_mime(image_data) is None:
+            raise AzureFaceAPIError(
+                "Unsupported image format. Supported formats: JPEG, PNG, BMP, GIF",
+                ERROR_INVALID_IMAGE,
+            )
+
+        # Add face to person
+        async with api_semaphore:
             result = await client.add_person_face(
                 person_group_id, person_id, image_data, detection_model
             )
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_person_management",
-                {
-                    "person_group_id": person_group_id,
-                    "person_id": person_id,
-                    "persisted_face_id": result["persistedFaceId"],
-                    "action": "image_uploaded",
-                },
-            )
-            
-            _LOGGER.info("Successfully uploaded image for person %s", person_id)
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error during image upload: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_person_management",
-                {
-                    "person_group_id": person_group_id,
-                    "person_id": person_id,
-                    "action": "image_uploaded",
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error during image upload: %s", err)
-            raise HomeAssistantError(f"Image upload failed: {err}") from err
+        event["persisted_face_id"] = result["persistedFaceId"]
+
+        _LOGGER.info("Successfully uploaded image for person %s", person_id)
 
-    async def async_get_training_status(call: ServiceCall) -> None:
+    @_api_service(EVENT_TRAINING_STATUS, "Training status lookup")
+    async def async_get_training_status(call: ServiceCall, event: Dict[str, Any]) -> None:
         """Get the training status of the person group."""
         person_group_id = call.data.get(CONF_PERSON_GROUP_ID)
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            if not person_group_id:
-                person_group_id = await get_person_group_id(hass)
-            
-            # Get training status
-            status = await client.get_person_group_training_status(person_group_id)
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_training_status",
-                {
-                    "person_group_id": person_group_id,
-                    "status": status["status"],
-                    "created_time": status.get("createdTime"),
-                    "last_action_time": status.get("lastActionTime"),
-                    "last_successful_training_time": status.get("lastSuccessfulTrainingTime"),
-                    "message": status.get("message"),
-                },
-            )
-            
-            _LOGGER.info("Training status for group %s: %s", person_group_id, status["status"])
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error getting training status: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_training_status",
-                {
-                    "person_group_id": person_group_id,
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error getting training status: %s", err)
-            raise HomeAssistantError(f"Getting training status failed: {err}") from err
+        event["person_group_id"] = person_group_id
 
-    async def async_list_persons(call: ServiceCall) -> None:
-        """List all persons in the person group."""
-        person_group_id = call.data.get(CONF_PERSON_GROUP_ID)
-        
-        try:
-            # Get the Azure Face client
-            client = await get_azure_face_client(hass)
-            if not person_group_id:
-                person_group_id = await get_person_group_id(hass)
-            
-            # List persons
-            persons = await client.list_persons(person_group_id)
-            
-            # Fire event with result
-            hass.bus.async_fire(
-                f"{DOMAIN}_persons_list",
-                {
-                    "person_group_id": person_group_id,
-                    "persons": persons,
-                },
-            )
-            
-            _LOGGER.info("Listed %d persons in group %s", len(persons), person_group_id)
-            
-        except AzureFaceAPIError as err:
-            _LOGGER.error("Azure Face API error listing persons: %s", err)
-            hass.bus.async_fire(
-                f"{DOMAIN}_persons_list",
-                {
-                    "person_group_id": person_group_id,
-                    "error": str(err),
-                },
-            )
-            raise HomeAssistantError(f"Azure Face API error: {err}") from err
-        
-        except Exception as err:
-            _LOGGER.error("Unexpected error listing persons: %s", err)
-            raise HomeAssistantError(f"Listing persons failed: {err}") from err
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+        if not person_group_id:
+            person_group_id = event["person_group_id"] = get_person_group_id(hass)
 
-    # Register services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_RECOGNIZE_FACE,
-        async_recognize_face,
-        schema=SERVICE_RECOGNIZE_FACE_SCHEMA,
-    )
+        # Get training status
+        async with api_semaphore:
+            status = await client.get_person_group_training_status(person_group_id)
+        event.update(
+            status=status["status"],
+            created_time=status.get("createdTime"),
+            last_action_time=status.get("lastActionTime"),
+            last_successful_training_time=status.get("lastSuccessfulTrainingTime"),
+            message=status.get("message"),
+        )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TRAIN_PERSON,
-        async_train_person,
-        schema=SERVICE_TRAIN_PERSON_SCHEMA,
-    )
+        _LOGGER.info("Training status for group %s: %s", person_group_id, status["status"])
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_PERSON_GROUP,
-        async_create_person_group,
-        schema=SERVICE_CREATE_PERSON_GROUP_SCHEMA,
-    )
+    @_api_service(EVENT_PERSONS_LIST, "Person listing")
+    async def async_list_persons(call: ServiceCall, event: Dict[str, Any]) -> None:
+        """List all persons in the person group."""
+        person_group_id = call.data.get(CONF_PERSON_GROUP_ID)
+        event["person_group_id"] = person_group_id
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_TRAIN_GROUP,
-        async_train_group,
-        schema=SERVICE_TRAIN_GROUP_SCHEMA,
-    )
+        # Get the Azure Face client
+        client = get_azure_face_client(hass)
+        api_semaphore = get_api_semaphore(hass)
+        if not person_group_id:
+            person_group_id = event["person_group_id"] = get_person_group_id(hass)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_CREATE_PERSON,
-        async_create_person,
-        schema=SERVICE_CREATE_PERSON_SCHEMA,
-    )
+        # List persons
+        async with api_semaphore:
+            persons = event["persons"] = await client.list_persons(person_group_id)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPLOAD_PERSON_IMAGE,
-        async_upload_person_image,
-        schema=SERVICE_UPLOAD_PERSON_IMAGE_SCHEMA,
-    )
+        _LOGGER.info("Listed %d persons in group %s", len(persons), person_group_id)
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_GET_TRAINING_STATUS,
-        async_get_training_status,
-        schema=SERVICE_GET_TRAINING_STATUS_SCHEMA,
+    # Register services
+    services = (
+        (SERVICE_RECOGNIZE_FACE, async_recognize_face, SERVICE_RECOGNIZE_FACE_SCHEMA),
+        (SERVICE_TRAIN_PERSON, async_train_person, SERVICE_TRAIN_PERSON_SCHEMA),
+        (SERVICE_CREATE_PERSON_GROUP, async_create_person_group, SERVICE_CREATE_PERSON_GROUP_SCHEMA),
+        (SERVICE_TRAIN_GROUP, async_train_group, SERVICE_TRAIN_GROUP_SCHEMA),
+        (SERVICE_CREATE_PERSON, async_create_person, SERVICE_CREATE_PERSON_SCHEMA),
+        (SERVICE_UPLOAD_PERSON_IMAGE, async_upload_person_image, SERVICE_UPLOAD_PERSON_IMAGE_SCHEMA),
+        (SERVICE_GET_TRAINING_STATUS, async_get_training_status, SERVICE_GET_TRAINING_STATUS_SCHEMA),
+        (SERVICE_LIST_PERSONS, async_list_persons, SERVICE_LIST_PERSONS_SCHEMA),
     )
 
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_LIST_PERSONS,
-        async_list_persons,
-        schema=SERVICE_LIST_PERSONS_SCHEMA,
-    )
\ No newline at end of file
+    for service, handler, schema in services:
+        hass.services.async_register(
+            DOMAIN, service, handler, schema=None if fast_mode else schema
+        )